@@ -7,17 +7,48 @@ Simple Tkinter Contacts App
 - Lets you pick the CSV location if you want
 """
 
-import csv
 import json
 import os
+import re
+import subprocess
 import sys
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from datetime import datetime
+
+try:
+    import orjson  # optional, faster state (de)serialization
+except ImportError:
+    orjson = None
 
 APP_TITLE = "Simple Contacts App"
 STATE_FILENAME = "state.json"
 DEFAULT_CSV = "contacts.csv"
+CSV_HEADER = b"timestamp,name,address,phone\r\n"
+# O_BINARY only exists (and matters) on Windows; it stops CRLF translation
+CSV_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+STATE_SAVE_DELAY_MS = 500  # coalesce bursts of state saves into one write
+
+# Shared grid options for the form rows
+ROW_KW = {"pady": 6}
+
+_NON_DIGITS_RE = re.compile(r"\D+")
+_PHONE_FMT_RE = re.compile(r"\(\d{3}\) \d{3}-\d{4}")
+_DIGITS10_RE = re.compile(r"\d{10}")
+
+
+def json_dumps(data) -> bytes:
+    # Compact UTF-8 JSON; orjson when available, stdlib otherwise
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def script_dir() -> str:
@@ -28,14 +59,41 @@ def script_dir() -> str:
         return os.getcwd()
 
 
+# Resolved once at import; the script location doesn't change while running
+_BASE_DIR = script_dir()
+_STATE_PATH = os.path.join(_BASE_DIR, STATE_FILENAME)
+
+
+# Pick the platform's folder opener once at import
+if sys.platform.startswith("win"):
+    open_folder = os.startfile
+else:
+    _FOLDER_OPENER = "open" if sys.platform == "darwin" else "xdg-open"
+
+    def open_folder(folder: str):
+        subprocess.Popen([_FOLDER_OPENER, folder], close_fds=True)
+
+
 def sanitize_phone(raw: str) -> str:
-    digits = [c for c in raw if c.isdigit()]
+    # Fast paths: already formatted, or exactly 10 bare digits
+    if _PHONE_FMT_RE.fullmatch(raw):
+        return raw
+    if _DIGITS10_RE.fullmatch(raw):
+        return f"({raw[0:3]}) {raw[3:6]}-{raw[6:10]}"
+    digits = _NON_DIGITS_RE.sub("", raw)
     if not digits:
         return ""
-    # Basic US-formatting when 10 digits; otherwise return digits joined
+    # Basic US-formatting when 10 digits; otherwise return digits as-is
     if len(digits) == 10:
-        return f"({''.join(digits[0:3])}) {''.join(digits[3:6])}-{''.join(digits[6:10])}"
-    return ''.join(digits)
+        return f"({digits[0:3]}) {digits[3:6]}-{digits[6:10]}"
+    return digits
+
+
+def csv_field(value: str) -> str:
+    # Quote per RFC 4180 only when needed (same rules csv.writer applies by default)
+    if any(c in value for c in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
 
 
 class ContactsApp(tk.Tk):
@@ -45,24 +103,48 @@ class ContactsApp(tk.Tk):
         self.geometry("520x420")
         self.minsize(520, 420)
 
-        # Resolve paths
-        self._base_dir = script_dir()
-        self._state_path = os.path.join(self._base_dir, STATE_FILENAME)
-
-        # Load state before building UI so defaults are ready
-        self.state = self._load_state()
-
-        # CSV path
-        self.csv_path_var = tk.StringVar(value=self.state.get("csv_path") or os.path.join(self._base_dir, DEFAULT_CSV))
+        # One Style instance for the app; widgets use the default style names
+        self._style = ttk.Style(self)
 
-        # Form variables
-        self.name_var = tk.StringVar(value=self.state.get("form", {}).get("name", ""))
-        self.phone_var = tk.StringVar(value=self.state.get("form", {}).get("phone", ""))
+        # Resolve paths
+        self._base_dir = _BASE_DIR
+        self._state_path = _STATE_PATH
+
+        # Read state in the background so the disk read overlaps with building the UI
+        self.state = {}
+        self._state_loader = threading.Thread(target=self._load_state_into, daemon=True)
+        self._state_loader.start()
+
+        # CSV file descriptor is kept open across saves (O_APPEND, unbuffered)
+        self._csv_fd = None
+        self._csv_fd_path = None
+        self._ensured_dirs: set[str] = set()  # directories already created/checked for the CSV
+
+        # Pending after() id for a debounced state write
+        self._save_pending = None
+        # Snapshot of the last successfully written state, to skip no-op writes
+        self._last_state_key = None
+
+        # Address text is re-read from the widget only after it's been edited
+        self._cached_address = ""
+        self._addr_dirty = True
+
+        # CSV path and form variables (filled from state once it's loaded)
+        self.csv_path_var = tk.StringVar()
+        # Validated absolute CSV path, refreshed whenever the entry changes ("" if unset)
+        self._csv_path = ""
+        self.csv_path_var.trace_add("write", self._on_csv_path_changed)
+        self.name_var = tk.StringVar()
+        self.phone_var = tk.StringVar()
 
         self._build_ui()
 
-        # Restore address (multiline) after widgets exist
-        self.addr_text.insert("1.0", self.state.get("form", {}).get("address", ""))
+        # Wait for the state read, then restore values now that widgets exist
+        self._state_loader.join()
+        self.csv_path_var.set(self.state.get("csv") or os.path.join(self._base_dir, DEFAULT_CSV))
+        self.name_var.set(self.state.get("n", ""))
+        self.phone_var.set(self.state.get("p", ""))
+        self.addr_text.insert("1.0", self.state.get("a", ""))
 
         # Wire close handler to persist state
         self.protocol("WM_DELETE_WINDOW", self.on_exit)
@@ -80,30 +162,28 @@ class ContactsApp(tk.Tk):
         csv_entry.pack(side="left", fill="x", expand=True, padx=(8, 8))
         ttk.Button(csv_row, text="Browse…", command=self.choose_csv).pack(side="left")
 
+        # Form fields share one grid: labels in column 0, inputs stretch in column 1
         form = ttk.LabelFrame(outer, text="Contact Details", padding=12)
         form.pack(fill="both", expand=True)
+        form.columnconfigure(1, weight=1)
+        form.rowconfigure(1, weight=1)  # address row takes the extra height
 
         # Name
-        name_row = ttk.Frame(form)
-        name_row.pack(fill="x", pady=6)
-        ttk.Label(name_row, text="Name:", width=12).pack(side="left")
-        name_entry = ttk.Entry(name_row, textvariable=self.name_var)
-        name_entry.pack(side="left", fill="x", expand=True)
+        ttk.Label(form, text="Name:", width=12).grid(row=0, column=0, sticky="w", **ROW_KW)
+        name_entry = ttk.Entry(form, textvariable=self.name_var)
+        name_entry.grid(row=0, column=1, sticky="ew", **ROW_KW)
         name_entry.focus_set()
 
         # Address (multiline)
-        addr_row = ttk.Frame(form)
-        addr_row.pack(fill="both", expand=True, pady=6)
-        ttk.Label(addr_row, text="Address:", width=12).pack(side="left", anchor="n", pady=(4,0))
-        self.addr_text = tk.Text(addr_row, height=5, wrap="word")
-        self.addr_text.pack(side="left", fill="both", expand=True)
+        ttk.Label(form, text="Address:", width=12).grid(row=1, column=0, sticky="nw", pady=(10, 6))
+        self.addr_text = tk.Text(form, height=5, wrap="word")
+        self.addr_text.grid(row=1, column=1, sticky="nsew", **ROW_KW)
+        self.addr_text.bind("<<Modified>>", self._on_addr_modified)
 
         # Phone
-        phone_row = ttk.Frame(form)
-        phone_row.pack(fill="x", pady=6)
-        ttk.Label(phone_row, text="Phone:", width=12).pack(side="left")
-        phone_entry = ttk.Entry(phone_row, textvariable=self.phone_var)
-        phone_entry.pack(side="left", fill="x", expand=True)
+        ttk.Label(form, text="Phone:", width=12).grid(row=2, column=0, sticky="w", **ROW_KW)
+        phone_entry = ttk.Entry(form, textvariable=self.phone_var)
+        phone_entry.grid(row=2, column=1, sticky="ew", **ROW_KW)
 
         # Buttons
         btns = ttk.Frame(outer)
@@ -132,8 +212,10 @@ class ContactsApp(tk.Tk):
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
         if path:
+            self._close_csv()
+            self._ensured_dirs.clear()  # re-check directories after the user picks a location
             self.csv_path_var.set(path)
-            self._save_state()  # persist choice immediately
+            self._schedule_save_state()  # persist choice
 
     def open_csv_folder(self):
         path = self.csv_path_var.get()
@@ -142,24 +224,20 @@ class ContactsApp(tk.Tk):
             return
         folder = os.path.dirname(path)
         try:
-            if sys.platform.startswith("win"):
-                os.startfile(folder)
-            elif sys.platform == "darwin":
-                os.system(f'open "{folder}"')
-            else:
-                os.system(f'xdg-open "{folder}"')
+            open_folder(folder)
         except Exception as e:
             messagebox.showerror(APP_TITLE, f"Could not open folder:\n{e}")
 
     def clear_form(self):
         self.name_var.set("")
         self.addr_text.delete("1.0", "end")
+        self._addr_dirty = True  # don't wait for the queued <<Modified>> event
         self.phone_var.set("")
-        self._save_state()  # keep state consistent
+        self._schedule_save_state()  # keep state consistent
 
     def save_entry(self):
         name = self.name_var.get().strip()
-        address = self.addr_text.get("1.0", "end").strip()
+        address = self._address()
         phone = sanitize_phone(self.phone_var.get().strip())
 
         if not name:
@@ -173,43 +251,105 @@ class ContactsApp(tk.Tk):
             if not messagebox.askyesno(APP_TITLE, "Phone is empty or invalid. Save anyway?"):
                 return
 
-        path = self.csv_path_var.get().strip()
+        path = self._csv_path
         if not path:
             messagebox.showwarning(APP_TITLE, "Please choose a CSV file location.")
             return
 
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-
-        is_new_file = not os.path.exists(path) or os.path.getsize(path) == 0
-
         try:
-            with open(path, mode="a", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                if is_new_file:
-                    writer.writerow(["timestamp", "name", "address", "phone"])
-                writer.writerow([datetime.now().isoformat(timespec="seconds"), name, address, phone])
+            ts = time.strftime("%Y-%m-%dT%H:%M:%S")  # same as datetime.isoformat(timespec="seconds")
+            self._flush_rows(path, [(ts, name, address, phone)])
         except Exception as e:
             messagebox.showerror(APP_TITLE, f"Could not write to CSV:\n{e}")
             return
 
         # After saving, also update the remembered form so you can "pick up" later if desired
-        self._save_state()
+        self._schedule_save_state()
         messagebox.showinfo(APP_TITLE, "Entry saved to CSV.")
         # Optionally clear after save (comment this out if you prefer keeping values)
         self.clear_form()
 
+    def _on_csv_path_changed(self, *_args):
+        path = self.csv_path_var.get().strip()
+        self._csv_path = os.path.abspath(path) if path else ""
+
+    def _on_addr_modified(self, _event=None):
+        # Resetting the flag fires <<Modified>> again, so only react when it's set
+        if self.addr_text.edit_modified():
+            self._addr_dirty = True
+            self.addr_text.edit_modified(False)
+
+    def _address(self) -> str:
+        if self._addr_dirty:
+            self._cached_address = self.addr_text.get("1.0", "end").strip()
+            self._addr_dirty = False
+        return self._cached_address
+
     def on_exit(self):
-        self._save_state()
+        self._close_csv()
+        self._do_save_state()
         self.destroy()
 
+    # ---------- CSV handle ----------
+    def _open_csv(self, path: str) -> int:
+        # Reuse the open descriptor unless the target file changed
+        if self._csv_fd is not None and self._csv_fd_path != path:
+            self._close_csv()
+        if self._csv_fd is None:
+            fd = os.open(path, CSV_OPEN_FLAGS, 0o644)
+            try:
+                # End of file at offset 0 means it is new/empty
+                if os.lseek(fd, 0, os.SEEK_END) == 0:
+                    self._write_all(fd, CSV_HEADER)
+            except Exception:
+                os.close(fd)
+                raise
+            self._csv_fd = fd
+            self._csv_fd_path = path
+        return self._csv_fd
+
+    @staticmethod
+    def _write_all(fd: int, buf: bytes):
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(fd, view):]
+
+    def _flush_rows(self, path: str, rows):
+        # Append (timestamp, name, address, phone) rows in one write; raises on I/O errors
+        folder = os.path.dirname(path) or "."
+        if folder not in self._ensured_dirs:
+            os.makedirs(folder, exist_ok=True)
+            self._ensured_dirs.add(folder)
+
+        buf = "".join(
+            f"{ts},{csv_field(name)},{csv_field(address)},{csv_field(phone)}\r\n"
+            for ts, name, address, phone in rows
+        ).encode("utf-8")
+        self._write_all(self._open_csv(path), buf)
+
+    def _close_csv(self):
+        if self._csv_fd is None:
+            return
+        try:
+            os.close(self._csv_fd)
+        except OSError:
+            pass
+        self._csv_fd = None
+        self._csv_fd_path = None
+
     # ---------- State (persistence of unsaved form + csv path) ----------
+    def _load_state_into(self):
+        # Thread target: only touches the filesystem, never Tk
+        self.state = self._load_state()
+
     def _load_state(self) -> dict:
         try:
-            with open(self._state_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self._state_path, "rb") as f:
+                data = json_loads(f.read())
                 if not isinstance(data, dict):
                     return {}
+                if "form" in data:
+                    data = self._migrate_state(data)
                 return data
         except FileNotFoundError:
             return {}
@@ -217,21 +357,52 @@ class ContactsApp(tk.Tk):
             # Corrupt state file—ignore
             return {}
 
+    @staticmethod
+    def _migrate_state(data: dict) -> dict:
+        # Older versions nested the form under "form"; the next save writes the flat layout
+        form = data.get("form")
+        if not isinstance(form, dict):
+            form = {}
+        return {
+            "csv": data.get("csv_path", ""),
+            "n": form.get("name", ""),
+            "a": form.get("address", ""),
+            "p": form.get("phone", ""),
+        }
+
+    def _schedule_save_state(self):
+        if self._save_pending is not None:
+            self.after_cancel(self._save_pending)
+        self._save_pending = self.after(STATE_SAVE_DELAY_MS, self._do_save_state)
+
+    def _do_save_state(self):
+        # Runs the pending write now (also used synchronously on exit)
+        if self._save_pending is not None:
+            self.after_cancel(self._save_pending)
+            self._save_pending = None
+        self._save_state()
+
     def _save_state(self):
+        # Flat keys: csv path, name, address, phone
         data = {
-            "csv_path": self.csv_path_var.get().strip(),
-            "form": {
-                "name": self.name_var.get(),
-                "address": self.addr_text.get("1.0", "end").strip(),
-                "phone": self.phone_var.get(),
-            }
+            "csv": self.csv_path_var.get().strip(),
+            "n": self.name_var.get(),
+            "a": self._address(),
+            "p": self.phone_var.get(),
         }
+        key = (data["csv"], data["n"], data["a"], data["p"])
+        if key == self._last_state_key:
+            return
+        # Write to a temp file and swap it in, so a crash never leaves a truncated state.json
+        tmp_path = self._state_path + ".tmp"
         try:
-            with open(self._state_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            with open(tmp_path, "wb") as f:
+                f.write(json_dumps(data))
+            os.replace(tmp_path, self._state_path)
         except Exception:
             # Don't crash app due to state save failure
-            pass
+            return
+        self._last_state_key = key
 
 
 def main():